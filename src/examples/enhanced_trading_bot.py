@@ -6,36 +6,295 @@ Demonstrates how to use the enhanced market-adaptive API with proper strategy ex
 
 import requests
 import json
+import orjson
+import msgpack
 import time
+import os
 import logging
+import queue
+import atexit
+import threading
+import heapq
+import itertools
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
 from datetime import datetime, timedelta
+from dataclasses import dataclass, asdict
+from enum import IntEnum
 from typing import Dict, List, Optional, Any
-import pandas as pd
+import numpy as np
+
+# Configure logging - records are queued on the calling thread and written
+# to the file and console by a background listener thread
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('enhanced_trading_bot.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('enhanced_trading_bot.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Log message prefixes, chosen once; LOG_EMOJI=false switches to plain ASCII
+_LOG_EMOJI = os.getenv('LOG_EMOJI', 'true').lower() not in ('0', 'false', 'no')
+# Order path
+_ORDER_PREFIX = "✅ " if _LOG_EMOJI else ""
+_VALUE_PREFIX = "💰 " if _LOG_EMOJI else ""
+_STOP_PREFIX = "🛡️ " if _LOG_EMOJI else ""
+_CLOSE_PREFIX = "🔄 " if _LOG_EMOJI else ""
+_REASON_PREFIX = "📊 " if _LOG_EMOJI else ""
+# Per-symbol analysis
+_ANALYZE_PREFIX = "🔍 " if _LOG_EMOJI else ""
+_WARN_PREFIX = "⚠️ " if _LOG_EMOJI else ""
+_FAIL_PREFIX = "❌ " if _LOG_EMOJI else ""
+_SUCCESS_PREFIX = "✅ " if _LOG_EMOJI else ""
+_STATS_PREFIX = "📊 " if _LOG_EMOJI else ""
+# Cycles and portfolio status
+_START_PREFIX = "🚀 " if _LOG_EMOJI else ""
+_DONE_PREFIX = "🏁 " if _LOG_EMOJI else ""
+_BALANCE_PREFIX = "💰 " if _LOG_EMOJI else ""
+_POSITIONS_PREFIX = "📈 " if _LOG_EMOJI else ""
+_TRADES_PREFIX = "📋 " if _LOG_EMOJI else ""
+_EXPOSURE_PREFIX = "💼 " if _LOG_EMOJI else ""
+_LOOP_PREFIX = "🔄 " if _LOG_EMOJI else ""
+_SLEEP_PREFIX = "😴 " if _LOG_EMOJI else ""
+_STOPPED_PREFIX = "⏹️ " if _LOG_EMOJI else ""
+
+class Phase(IntEnum):
+    """Market phase reported in bot instructions"""
+    NEUTRAL = 0
+    ACCUMULATION = 1
+    DISTRIBUTION = 2
+    MARKUP = 3
+    MARKDOWN = 4
+    CONSOLIDATION = 5
+
+_PHASE_FROM_STR = {phase.name: phase for phase in Phase}
+
+class Side(IntEnum):
+    """Direction of a position or trade"""
+    LONG = 0
+    SHORT = 1
+
+@dataclass(slots=True)
+class Position:
+    """Open position held by the bot"""
+    symbol: str
+    side: Side
+    amount: float
+    value: float
+    entry_price: float
+    stop_loss: float
+    take_profit_levels: List[Any]
+    ts_ns: int
+    status: str = 'open'
+
+@dataclass(slots=True)
+class Trade:
+    """Executed open or close of a position"""
+    symbol: str
+    action: str
+    side: Side
+    amount: float
+    price: float
+    ts_ns: int
+    reason: Optional[str] = None
+
+def _record_to_dict(record) -> Dict:
+    """Plain dict of a Position/Trade with its ts_ns replaced by an ISO timestamp"""
+    data = asdict(record)
+    data['side'] = record.side.name.lower()
+    data['timestamp'] = datetime.fromtimestamp(data.pop('ts_ns') / 1e9).isoformat()
+    return data
+
+# Trade log files held open by live bots; each file is written by one bot only
+_open_trade_logs = set()
+_open_trade_logs_lock = threading.Lock()
+
+def _release_bot(lock: threading.Lock, trade_log, trade_log_path: str, session: requests.Session,
+                 order_scheduler: 'OrderScheduler'):
+    """Stop a bot's scheduled orders, close its trade log and HTTP session; runs once, from close() or at exit"""
+    order_scheduler.stop()
+    with lock:
+        trade_log.close()
+    with _open_trade_logs_lock:
+        _open_trade_logs.discard(trade_log_path)
+    session.close()
+
+class RateLimiter:
+    """
+    Sliding-window rate limiter shared by all worker threads.
+    Calls proceed immediately until max_calls have been made within the last
+    period seconds; only then does acquire() sleep until the oldest call expires.
+    """
+    
+    def __init__(self, max_calls: int = 10, period: float = 1.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a call is allowed under the rate limit"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                
+                wait = self.period - (now - self._calls[0])
+            
+            time.sleep(wait)
+
+class OrderScheduler:
+    """
+    Runs delayed order placements on a background thread.
+    Pending calls are kept in a heap ordered by due time, so scheduling never blocks the caller.
+    """
+    
+    def __init__(self):
+        self._pending = []
+        self._sequence = itertools.count()  # Keeps heap order stable for equal due times
+        self._running = False
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='order-scheduler', daemon=True)
+        self._thread.start()
+    
+    def schedule(self, delay: float, func, *args):
+        """Call func(*args) on the scheduler thread after delay seconds"""
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("cannot schedule orders after the scheduler is stopped")
+            heapq.heappush(self._pending, (time.monotonic() + delay, next(self._sequence), func, args))
+            self._condition.notify_all()
+    
+    def wait_until_idle(self):
+        """Block until every scheduled call has run"""
+        with self._condition:
+            while self._pending or self._running:
+                self._condition.wait()
+    
+    def stop(self):
+        """Drop pending calls, wait for a running one to finish and end the scheduler thread"""
+        with self._condition:
+            self._stopped = True
+            self._pending.clear()
+            self._condition.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopped:
+                        return
+                    now = time.monotonic()
+                    if self._pending and self._pending[0][0] <= now:
+                        break
+                    timeout = self._pending[0][0] - now if self._pending else None
+                    self._condition.wait(timeout)
+                
+                _, _, func, args = heapq.heappop(self._pending)
+                self._running = True
+            
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("Error running scheduled order")
+            finally:
+                with self._condition:
+                    self._running = False
+                    self._condition.notify_all()
+
 class EnhancedTradingBot:
     """
     Enhanced trading bot that uses the market-adaptive API to make intelligent trading decisions.
     """
     
     def __init__(self, api_key: str, base_url: str = "http://localhost:3000", 
-                 risk_level: str = "balanced", account_balance: float = 10000):
+                 risk_level: str = "balanced", account_balance: float = 10000,
+                 trade_log_path: str = "trades.msgpack"):
         self.api_key = api_key
         self.base_url = base_url
         self.risk_level = risk_level
         self.account_balance = account_balance
-        self.positions = []
-        self.trade_history = []
+        self.positions = {}  # symbol -> open position
+        self.trade_history = deque(maxlen=1000)  # Most recent trades; all trades go to the trade log
+        
+        # Each live bot appends to its own trade log; bots run side by side need their own trade_log_path
+        self.trade_log_path = os.path.abspath(trade_log_path)
+        with _open_trade_logs_lock:
+            if self.trade_log_path in _open_trade_logs:
+                raise ValueError(f"Trade log {trade_log_path} is already in use by another bot; "
+                                 "pass a different trade_log_path")
+            _open_trade_logs.add(self.trade_log_path)
+        self._trade_log = open(self.trade_log_path, 'ab')  # Append-only MessagePack records
+        self._trade_log_start = self._trade_log.tell()  # Records before this offset are from earlier runs
+        self._lock = threading.Lock()
+        
+        # Running trade statistics, updated as orders are placed and closed
+        self._stats = {'open': 0, 'closed': 0, 'symbols': set()}
+        
+        # HTTP settings - one pooled session shared by all worker threads
+        self.max_workers = 16
+        self.session = requests.Session()
+        # Retry throttled/unavailable responses, honouring the server's Retry-After.
+        # The API's POSTs are read-only queries, so they are safe to resend.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({'POST'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers,
+                              max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'X-API-Key': self.api_key
+        })
+        self.batch_supported = True  # Cleared on the first 404 from a batch endpoint
+        self.rate_limiter = RateLimiter(max_calls=10, period=1.0)  # API requests per second
+        self.order_scheduler = OrderScheduler()
+        # Release the scheduler, trade log and session at close() or interpreter exit
+        # without keeping the bot itself alive
+        self._finalizer = weakref.finalize(self, _release_bot, self._lock, self._trade_log,
+                                           self.trade_log_path, self.session, self.order_scheduler)
+        
+        # Static parts of the request payloads; per-call fields are merged in. risk_level
+        # is merged per call too, so payloads and cache keys follow changes to it.
+        self._base_signal_payload = {'include_reasoning': True}
+        self._base_instr_payload = {'bot_type': 'python'}
+        
+        # Response caches keyed by (symbol, timeframe, risk_level); TTL stays well under a 1h bar
+        self._signal_cache = TTLCache(maxsize=256, ttl=30)
+        self._instr_cache = TTLCache(maxsize=256, ttl=30)
+        self._cache_lock = threading.Lock()
         
         # Risk management settings
         self.max_portfolio_risk = 0.20  # 20% max portfolio risk
@@ -46,65 +305,187 @@ class EnhancedTradingBot:
         self.confidence_threshold = 50  # Minimum confidence for trades
         self.max_positions = 5  # Maximum concurrent positions
         
-        logger.info(f"Enhanced Trading Bot initialized with {risk_level} risk level")
-        logger.info(f"Account Balance: ${account_balance:,.2f}")
+        # Strategy executor per market phase, indexed by Phase value
+        self._phase_dispatch = [None] * len(Phase)
+        self._phase_dispatch[Phase.NEUTRAL] = self.execute_neutral_strategy
+        self._phase_dispatch[Phase.ACCUMULATION] = self.execute_accumulation_strategy
+        self._phase_dispatch[Phase.DISTRIBUTION] = self.execute_distribution_strategy
+        self._phase_dispatch[Phase.MARKUP] = self.execute_markup_strategy
+        self._phase_dispatch[Phase.MARKDOWN] = self.execute_markdown_strategy
+        self._phase_dispatch[Phase.CONSOLIDATION] = self.execute_consolidation_strategy
+        
+        # Numeric position fields as parallel arrays; slot i holds self._idx_to_sym[i]
+        capacity = self.max_positions * 2
+        self._amounts = np.zeros(capacity)
+        self._values = np.zeros(capacity)
+        self._entry_prices = np.zeros(capacity)
+        self._stop_losses = np.zeros(capacity)
+        self._sym_to_idx = {}
+        self._idx_to_sym = []
+        self._n = 0
+        
+        logger.info("Enhanced Trading Bot initialized with %s risk level", risk_level)
+        logger.info("Account Balance: $%.2f", account_balance)
+    
+    def _index_position(self, position: Position):
+        """Write a position's numeric fields into its array slot (caller holds the lock)"""
+        idx = self._sym_to_idx.get(position.symbol)
+        if idx is None:
+            if self._n == len(self._amounts):
+                grow = np.zeros(len(self._amounts))
+                self._amounts = np.concatenate([self._amounts, grow])
+                self._values = np.concatenate([self._values, grow])
+                self._entry_prices = np.concatenate([self._entry_prices, grow])
+                self._stop_losses = np.concatenate([self._stop_losses, grow])
+            idx = self._n
+            self._sym_to_idx[position.symbol] = idx
+            self._idx_to_sym.append(position.symbol)
+            self._n += 1
+        
+        self._amounts[idx] = position.amount
+        self._values[idx] = position.value
+        self._entry_prices[idx] = position.entry_price
+        self._stop_losses[idx] = position.stop_loss
+    
+    def _unindex_position(self, symbol: str):
+        """Free a symbol's array slot by moving the last slot into it (caller holds the lock)"""
+        idx = self._sym_to_idx.pop(symbol, None)
+        if idx is None:
+            return
+        
+        last = self._n - 1
+        if idx != last:
+            for arr in (self._amounts, self._values, self._entry_prices, self._stop_losses):
+                arr[idx] = arr[last]
+            moved_symbol = self._idx_to_sym[last]
+            self._idx_to_sym[idx] = moved_symbol
+            self._sym_to_idx[moved_symbol] = idx
+        
+        self._idx_to_sym.pop()
+        self._n -= 1
+    
+    def _record_trade(self, trade: Trade):
+        """Append a trade to the trade log and the recent history (caller holds the lock)"""
+        self._trade_log.write(msgpack.packb(_record_to_dict(trade)))
+        self.trade_history.append(trade)
+    
+    def read_trade_log(self):
+        """Yield every trade this bot recorded in the trade log, oldest first"""
+        with self._lock:
+            if not self._trade_log.closed:  # close() has already flushed everything
+                self._trade_log.flush()
+        
+        with open(self.trade_log_path, 'rb') as f:
+            f.seek(self._trade_log_start)
+            yield from msgpack.Unpacker(f, raw=False)
+    
+    def close(self):
+        """Cancel pending scheduled orders, flush the trade log and release the HTTP session"""
+        self._finalizer()
+    
+    def positions_view(self) -> List[Dict]:
+        """Snapshot of open positions as plain dicts, for API payloads"""
+        with self._lock:
+            return [_record_to_dict(position) for position in self.positions.values()]
+    
+    def total_position_value(self) -> float:
+        """Total value of all open positions"""
+        with self._lock:
+            return float(self._values[:self._n].sum())
+    
+    def _cache_lookup(self, cache: TTLCache, symbols: List[str], timeframe: str) -> Dict[str, Dict[str, Any]]:
+        """Return the unexpired cached responses for the given symbols"""
+        with self._cache_lock:
+            hits = {}
+            for symbol in symbols:
+                value = cache.get((symbol, timeframe, self.risk_level))
+                if value is not None:
+                    hits[symbol] = value
+            return hits
+    
+    def _cache_store(self, cache: TTLCache, results: Dict[str, Dict[str, Any]], timeframe: str):
+        """Cache successful responses keyed by symbol"""
+        with self._cache_lock:
+            for symbol, value in results.items():
+                cache[(symbol, timeframe, self.risk_level)] = value
     
     def get_enhanced_signal(self, symbol: str, timeframe: str = "1h") -> Dict[str, Any]:
         """Get enhanced signal from the API"""
+        cached = self._cache_lookup(self._signal_cache, [symbol], timeframe)
+        if symbol in cached:
+            return cached[symbol]
+        
         try:
             url = f"{self.base_url}/api/v1/signal"
-            headers = {
-                'Content-Type': 'application/json',
-                'X-API-Key': self.api_key
-            }
-            payload = {
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'risk_level': self.risk_level,
-                'include_reasoning': True
-            }
+            payload = {**self._base_signal_payload, 'risk_level': self.risk_level, 'symbol': symbol, 'timeframe': timeframe}
             
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            self.rate_limiter.acquire()
+            response = self.session.post(url, data=orjson.dumps(payload), timeout=30)
             response.raise_for_status()
             
-            return response.json()
+            signal = orjson.loads(response.content)
+            self._cache_store(self._signal_cache, {symbol: signal}, timeframe)
+            return signal
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error getting signal for {symbol}: {e}")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Error getting signal for %s: %s", symbol, e)
             return None
     
     def get_bot_instructions(self, symbol: str, timeframe: str = "1h") -> Dict[str, Any]:
         """Get bot-specific execution instructions"""
+        cached = self._cache_lookup(self._instr_cache, [symbol], timeframe)
+        if symbol in cached:
+            return cached[symbol]
+        
         try:
             url = f"{self.base_url}/api/v1/bot-instructions"
-            headers = {
-                'Content-Type': 'application/json',
-                'X-API-Key': self.api_key
-            }
-            payload = {
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'risk_level': self.risk_level,
-                'bot_type': 'python'
-            }
+            payload = {**self._base_instr_payload, 'risk_level': self.risk_level, 'symbol': symbol, 'timeframe': timeframe}
             
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            self.rate_limiter.acquire()
+            response = self.session.post(url, data=orjson.dumps(payload), timeout=30)
             response.raise_for_status()
             
-            return response.json()
+            instructions = self._parse_instructions(orjson.loads(response.content))
+            self._cache_store(self._instr_cache, {symbol: instructions}, timeframe)
+            return instructions
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error getting bot instructions for {symbol}: {e}")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Error getting bot instructions for %s: %s", symbol, e)
             return None
     
+    def _parse_instructions(self, instructions: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert instruction fields used on every trade once, when they arrive
+        
+        market_phase becomes a Phase (anything unrecognised maps to NEUTRAL),
+        keeping the server's value as market_phase_raw, and '%'-string price
+        offsets become fractions stored as price_offset_num. Parsing already
+        parsed instructions leaves them unchanged.
+        """
+        signal_summary = instructions.get('signal_summary')
+        if signal_summary is not None and 'market_phase_raw' not in signal_summary:
+            raw_phase = signal_summary.get('market_phase')
+            signal_summary['market_phase_raw'] = raw_phase
+            signal_summary['market_phase'] = _PHASE_FROM_STR.get(str(raw_phase), Phase.NEUTRAL)
+        
+        position_mgmt = instructions.get('execution_instructions', {}).get('position_management', {})
+        offset_fields = list(position_mgmt.get('scaling_levels') or [])
+        if position_mgmt.get('entry_method'):
+            offset_fields.append(position_mgmt['entry_method'])
+        
+        for field in offset_fields:
+            if 'price_offset' in field and 'price_offset_num' not in field:
+                try:
+                    field['price_offset_num'] = float(str(field['price_offset']).replace('%', '')) / 100
+                except ValueError:
+                    logger.warning("Invalid price offset in bot instructions: %s", field['price_offset'])
+        
+        return instructions
+    
     def validate_strategy(self, signal: Dict[str, Any]) -> Dict[str, Any]:
         """Validate strategy before execution"""
         try:
             url = f"{self.base_url}/api/v1/validate-strategy"
-            headers = {
-                'Content-Type': 'application/json',
-                'X-API-Key': self.api_key
-            }
+            existing_positions = self.positions_view()
             payload = {
                 'signal': signal,
                 'risk_params': {
@@ -113,57 +494,144 @@ class EnhancedTradingBot:
                     'max_portfolio_risk': self.max_portfolio_risk
                 },
                 'account_balance': self.account_balance,
-                'existing_positions': self.positions
+                'existing_positions': existing_positions
             }
             
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            self.rate_limiter.acquire()
+            response = self.session.post(url, data=orjson.dumps(payload), timeout=30)
             response.raise_for_status()
             
-            return response.json()
+            return orjson.loads(response.content)
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error validating strategy: {e}")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Error validating strategy: %s", e)
             return {'valid': False, 'error': str(e)}
     
+    def _post_batch(self, path: str, payload: Dict[str, Any], result_key: str) -> Optional[Dict[str, Any]]:
+        """POST to a batch endpoint, returning None if the server does not support batching"""
+        if not self.batch_supported:
+            return None
+        
+        url = f"{self.base_url}{path}"
+        
+        self.rate_limiter.acquire()
+        response = self.session.post(url, data=orjson.dumps(payload), timeout=30)
+        if response.status_code == 404:
+            logger.info("Batch endpoints not available, falling back to per-symbol requests")
+            self.batch_supported = False
+            return None
+        response.raise_for_status()
+        
+        return orjson.loads(response.content).get(result_key, {})
+    
+    def _map_concurrently(self, func, items: List[Any]) -> List[Any]:
+        """Run func over items on a worker pool sized for the HTTP session"""
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(items), self.max_workers)) as executor:
+            return list(executor.map(func, items))
+    
+    def get_enhanced_signals_batch(self, symbols: List[str], timeframe: str = "1h") -> Dict[str, Dict[str, Any]]:
+        """Get enhanced signals for several symbols in one request"""
+        cached = self._cache_lookup(self._signal_cache, symbols, timeframe)
+        missing = [s for s in symbols if s not in cached]
+        if not missing:
+            return cached
+        
+        try:
+            payload = {**self._base_signal_payload, 'risk_level': self.risk_level, 'symbols': missing, 'timeframe': timeframe}
+            
+            signals = self._post_batch('/api/v1/signal/batch', payload, 'signals')
+            if signals is None:
+                results = self._map_concurrently(lambda s: self.get_enhanced_signal(s, timeframe), missing)
+                signals = dict(zip(missing, results))
+            
+            malformed = [symbol for symbol, signal in signals.items() if signal and 'confidence' not in signal]
+            if malformed:
+                logger.warning("Skipping malformed signals for %s", ', '.join(malformed))
+            signals = {symbol: signal for symbol, signal in signals.items()
+                       if signal and 'confidence' in signal}
+            self._cache_store(self._signal_cache, signals, timeframe)
+            return {**cached, **signals}
+            
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Error getting batch signals: %s", e)
+            return cached
+    
+    def get_bot_instructions_batch(self, symbols: List[str], timeframe: str = "1h") -> Dict[str, Dict[str, Any]]:
+        """Get bot-specific execution instructions for several symbols in one request"""
+        cached = self._cache_lookup(self._instr_cache, symbols, timeframe)
+        missing = [s for s in symbols if s not in cached]
+        if not missing:
+            return cached
+        
+        try:
+            payload = {**self._base_instr_payload, 'risk_level': self.risk_level, 'symbols': missing, 'timeframe': timeframe}
+            
+            instructions = self._post_batch('/api/v1/bot-instructions/batch', payload, 'instructions')
+            if instructions is None:
+                results = self._map_concurrently(lambda s: self.get_bot_instructions(s, timeframe), missing)
+                instructions = dict(zip(missing, results))
+            
+            instructions = {symbol: self._parse_instructions(instr)
+                            for symbol, instr in instructions.items() if instr}
+            self._cache_store(self._instr_cache, instructions, timeframe)
+            return {**cached, **instructions}
+            
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Error getting batch bot instructions: %s", e)
+            return cached
+    
+    def validate_strategies_batch(self, signals: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Validate strategies for several symbols in one request"""
+        try:
+            existing_positions = self.positions_view()
+            payload = {
+                'signals': signals,
+                'risk_params': {
+                    'confidence_threshold': self.confidence_threshold,
+                    'max_position_size': self.max_position_size,
+                    'max_portfolio_risk': self.max_portfolio_risk
+                },
+                'account_balance': self.account_balance,
+                'existing_positions': existing_positions
+            }
+            
+            validations = self._post_batch('/api/v1/validate-strategy/batch', payload, 'validations')
+            if validations is None:
+                symbols = list(signals)
+                results = self._map_concurrently(lambda s: self.validate_strategy(signals[s]), symbols)
+                validations = dict(zip(symbols, results))
+            
+            return validations
+            
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Error validating batch strategies: %s", e)
+            return {}
+    
     def execute_strategy(self, symbol: str, instructions: Dict[str, Any]) -> bool:
         """Execute trading strategy based on bot instructions"""
-        try:
-            signal_summary = instructions['signal_summary']
-            execution_instructions = instructions['execution_instructions']
-            
-            logger.info(f"Executing {signal_summary['action']} strategy for {symbol}")
-            logger.info(f"Market Phase: {signal_summary['market_phase']}")
-            logger.info(f"Strategy Type: {signal_summary['strategy_type']}")
-            logger.info(f"Confidence: {signal_summary['confidence']}%")
-            
-            # Get execution details
-            position_mgmt = execution_instructions['position_management']
-            risk_mgmt = execution_instructions['risk_management']
-            
-            # Execute based on market phase and strategy
-            market_phase = signal_summary['market_phase']
-            action = signal_summary['action']
-            
-            if market_phase == 'ACCUMULATION':
-                return self.execute_accumulation_strategy(symbol, position_mgmt, risk_mgmt)
-            elif market_phase == 'DISTRIBUTION':
-                return self.execute_distribution_strategy(symbol, position_mgmt, risk_mgmt)
-            elif market_phase == 'MARKUP':
-                return self.execute_markup_strategy(symbol, position_mgmt, risk_mgmt)
-            elif market_phase == 'MARKDOWN':
-                return self.execute_markdown_strategy(symbol, position_mgmt, risk_mgmt)
-            elif market_phase == 'CONSOLIDATION':
-                return self.execute_consolidation_strategy(symbol, position_mgmt, risk_mgmt)
-            else:
-                return self.execute_neutral_strategy(symbol, position_mgmt, risk_mgmt)
-                
-        except Exception as e:
-            logger.error(f"Error executing strategy for {symbol}: {e}")
-            return False
+        # Fetched instructions are already parsed; raw ones passed in by callers are parsed here
+        instructions = self._parse_instructions(instructions)
+        signal_summary = instructions['signal_summary']
+        execution_instructions = instructions['execution_instructions']
+        
+        logger.info("Executing %s strategy for %s", signal_summary['action'], symbol)
+        logger.info("Market Phase: %s", signal_summary['market_phase_raw'])
+        logger.info("Strategy Type: %s", signal_summary['strategy_type'])
+        logger.info("Confidence: %s%%", signal_summary['confidence'])
+        
+        # Get execution details
+        position_mgmt = execution_instructions['position_management']
+        risk_mgmt = execution_instructions['risk_management']
+        
+        # Execute based on market phase
+        strategy = self._phase_dispatch[signal_summary['market_phase']]
+        return strategy(symbol, position_mgmt, risk_mgmt)
     
     def execute_accumulation_strategy(self, symbol: str, position_mgmt: Dict, risk_mgmt: Dict) -> bool:
         """Execute accumulation strategy with scaled entry"""
-        logger.info(f"Executing accumulation strategy for {symbol}")
+        logger.info("Executing accumulation strategy for %s", symbol)
         
         entry_method = position_mgmt['entry_method']
         position_size = position_mgmt['position_size']['percentage']
@@ -174,7 +642,7 @@ class EnhancedTradingBot:
             
             for i, level in enumerate(scaling_levels):
                 order_size = position_size * (level['percentage'] / 100)
-                price_offset = float(level['price_offset'].replace('%', '')) / 100
+                price_offset = level['price_offset_num']
                 
                 # Simulate order placement
                 order = {
@@ -183,31 +651,30 @@ class EnhancedTradingBot:
                     'amount': order_size,
                     'price_offset': price_offset,
                     'type': 'limit',
-                    'delay': i * 900,  # 15 minutes between orders
-                    'timestamp': datetime.now()
+                    'delay': i * 900  # 15 minutes between orders
                 }
                 
-                logger.info(f"Placing accumulation order {i+1}: {order_size:.4f} at {price_offset:.2%} offset")
+                logger.info("Placing accumulation order %s: %.4f at %.2f%% offset", i+1, order_size, price_offset * 100)
                 
-                # In real implementation, place actual order here
-                self.simulate_order_placement(order, risk_mgmt)
-                
-                # Delay between orders
-                if i < len(scaling_levels) - 1:
-                    time.sleep(5)  # Simulate delay (reduced for demo)
+                # In real implementation, place actual order here; later levels
+                # are placed by the scheduler so this thread is not held up
+                if i == 0:
+                    self.simulate_order_placement(order, risk_mgmt)
+                else:
+                    self.order_scheduler.schedule(i * 5, self.simulate_order_placement, order, risk_mgmt)  # Simulated delay (reduced for demo)
         
         return True
     
     def execute_distribution_strategy(self, symbol: str, position_mgmt: Dict, risk_mgmt: Dict) -> bool:
         """Execute distribution strategy with risk-off positioning"""
-        logger.info(f"Executing distribution strategy for {symbol}")
+        logger.info("Executing distribution strategy for %s", symbol)
         
         # Check if we have existing positions to exit
         existing_position = self.get_position(symbol)
         
         if existing_position:
             # Exit existing position
-            logger.info(f"Exiting existing position in {symbol}")
+            logger.info("Exiting existing position in %s", symbol)
             self.simulate_position_exit(existing_position, 'distribution_exit')
         
         # Consider short opportunity if confidence is high
@@ -216,18 +683,17 @@ class EnhancedTradingBot:
                 'symbol': symbol,
                 'side': 'sell',
                 'amount': position_mgmt['position_size']['percentage'],
-                'type': 'market',
-                'timestamp': datetime.now()
+                'type': 'market'
             }
             
-            logger.info(f"Placing distribution short order: {order['amount']:.4f}")
+            logger.info("Placing distribution short order: %.4f", order['amount'])
             self.simulate_order_placement(order, risk_mgmt)
         
         return True
     
     def execute_markup_strategy(self, symbol: str, position_mgmt: Dict, risk_mgmt: Dict) -> bool:
         """Execute markup strategy with trend following"""
-        logger.info(f"Executing markup strategy for {symbol}")
+        logger.info("Executing markup strategy for %s", symbol)
         
         entry_method = position_mgmt['entry_method']
         
@@ -237,23 +703,22 @@ class EnhancedTradingBot:
                 'symbol': symbol,
                 'side': 'buy',
                 'amount': position_mgmt['position_size']['percentage'],
-                'type': 'market',
-                'timestamp': datetime.now()
+                'type': 'market'
             }
             
-            logger.info(f"Placing immediate trend-following order: {order['amount']:.4f}")
+            logger.info("Placing immediate trend-following order: %.4f", order['amount'])
             self.simulate_order_placement(order, risk_mgmt)
         
         return True
     
     def execute_markdown_strategy(self, symbol: str, position_mgmt: Dict, risk_mgmt: Dict) -> bool:
         """Execute markdown strategy with defensive positioning"""
-        logger.info(f"Executing markdown strategy for {symbol}")
+        logger.info("Executing markdown strategy for %s", symbol)
         
         # Exit long positions if any
         existing_position = self.get_position(symbol)
-        if existing_position and existing_position['side'] == 'long':
-            logger.info(f"Exiting long position in {symbol} due to markdown phase")
+        if existing_position and existing_position.side == Side.LONG:
+            logger.info("Exiting long position in %s due to markdown phase", symbol)
             self.simulate_position_exit(existing_position, 'markdown_exit')
         
         # Consider short opportunity for oversold bounce
@@ -262,40 +727,40 @@ class EnhancedTradingBot:
                 'symbol': symbol,
                 'side': 'sell',
                 'amount': position_mgmt['position_size']['percentage'],
-                'type': 'limit',
-                'timestamp': datetime.now()
+                'type': 'limit'
             }
             
-            logger.info(f"Placing markdown short order: {order['amount']:.4f}")
+            logger.info("Placing markdown short order: %.4f", order['amount'])
             self.simulate_order_placement(order, risk_mgmt)
         
         return True
     
     def execute_consolidation_strategy(self, symbol: str, position_mgmt: Dict, risk_mgmt: Dict) -> bool:
         """Execute consolidation strategy with range trading"""
-        logger.info(f"Executing consolidation strategy for {symbol}")
+        logger.info("Executing consolidation strategy for %s", symbol)
         
         entry_method = position_mgmt['entry_method']
         
         if entry_method['type'] == 'limit_entry':
-            # Range trading with limit orders
+            # Range trading with limit orders; -0.1% only when no offset was given,
+            # an offset that failed to parse has no price_offset_num and raises KeyError
+            price_offset = entry_method['price_offset_num'] if 'price_offset' in entry_method else -0.001
             order = {
                 'symbol': symbol,
                 'side': 'buy',
                 'amount': position_mgmt['position_size']['percentage'],
                 'type': 'limit',
-                'price_offset': float(entry_method.get('price_offset', '-0.1%').replace('%', '')) / 100,
-                'timestamp': datetime.now()
+                'price_offset': price_offset
             }
             
-            logger.info(f"Placing range trading order: {order['amount']:.4f} at {order['price_offset']:.2%} offset")
+            logger.info("Placing range trading order: %.4f at %.2f%% offset", order['amount'], order['price_offset'] * 100)
             self.simulate_order_placement(order, risk_mgmt)
         
         return True
     
     def execute_neutral_strategy(self, symbol: str, position_mgmt: Dict, risk_mgmt: Dict) -> bool:
         """Execute neutral strategy with opportunistic approach"""
-        logger.info(f"Executing neutral strategy for {symbol}")
+        logger.info("Executing neutral strategy for %s", symbol)
         
         # Conservative approach - only trade with high confidence
         if position_mgmt['position_size']['percentage'] > 0:
@@ -303,209 +768,348 @@ class EnhancedTradingBot:
                 'symbol': symbol,
                 'side': 'buy',
                 'amount': position_mgmt['position_size']['percentage'] * 0.5,  # Reduce size for neutral
-                'type': 'limit',
-                'timestamp': datetime.now()
+                'type': 'limit'
             }
             
-            logger.info(f"Placing neutral opportunity order: {order['amount']:.4f}")
+            logger.info("Placing neutral opportunity order: %.4f", order['amount'])
             self.simulate_order_placement(order, risk_mgmt)
         
         return True
     
     def simulate_order_placement(self, order: Dict, risk_mgmt: Dict) -> bool:
         """Simulate order placement (replace with actual broker API)"""
-        try:
-            # Calculate position value
-            position_value = self.account_balance * order['amount']
-            
-            # Create position record
-            position = {
-                'symbol': order['symbol'],
-                'side': 'long' if order['side'] == 'buy' else 'short',
-                'amount': order['amount'],
-                'value': position_value,
-                'entry_price': 50000,  # Simulated price
-                'stop_loss': risk_mgmt['stop_loss']['price'],
-                'take_profit_levels': risk_mgmt['take_profit']['levels'],
-                'timestamp': order['timestamp'],
-                'status': 'open'
-            }
-            
-            # Add to positions
-            self.positions.append(position)
-            
-            # Add to trade history
-            trade = {
-                'symbol': order['symbol'],
-                'action': 'open',
-                'side': position['side'],
-                'amount': order['amount'],
-                'price': position['entry_price'],
-                'timestamp': order['timestamp']
-            }
-            
-            self.trade_history.append(trade)
-            
-            logger.info(f"✅ Order placed: {order['side'].upper()} {order['amount']:.4f} {order['symbol']}")
-            logger.info(f"💰 Position value: ${position_value:,.2f}")
-            logger.info(f"🛡️ Stop loss: ${risk_mgmt['stop_loss']['price']:,.2f}")
-            
-            return True
+        # Calculate position value
+        position_value = self.account_balance * order['amount']
+        side = Side.LONG if order['side'] == 'buy' else Side.SHORT
+        ts_ns = time.time_ns()  # Stamped when placed, which for scheduled orders is after they were built
+        
+        # Create position record
+        position = Position(
+            symbol=order['symbol'],
+            side=side,
+            amount=order['amount'],
+            value=position_value,
+            entry_price=50000,  # Simulated price
+            stop_loss=risk_mgmt['stop_loss']['price'],
+            take_profit_levels=risk_mgmt['take_profit']['levels'],
+            ts_ns=ts_ns
+        )
+        
+        # Add to trade history
+        trade = Trade(
+            symbol=order['symbol'],
+            action='open',
+            side=side,
+            amount=order['amount'],
+            price=position.entry_price,
+            ts_ns=ts_ns
+        )
+        
+        # Add to positions; an order against the open position reverses it,
+        # closing and opening under one lock hold
+        with self._lock:
+            existing_position = self.positions.get(order['symbol'])
+            # analyze_symbol's position limit check runs on several workers at once,
+            # so the limit is enforced again where positions are opened
+            if existing_position is None and len(self.positions) >= self.max_positions:
+                logger.info("%sMaximum positions (%s) reached, skipping %s", _STATS_PREFIX, self.max_positions, order['symbol'])
+                return False
+            reversed_position = None
+            if existing_position and existing_position.side != side:
+                self._close_position(existing_position, 'reversal')
+                reversed_position, existing_position = existing_position, None
             
-        except Exception as e:
-            logger.error(f"Error simulating order placement: {e}")
-            return False
+            if existing_position:
+                # Scale into the open position on the same side
+                total_amount = existing_position.amount + order['amount']
+                existing_position.entry_price = (
+                    existing_position.entry_price * existing_position.amount
+                    + position.entry_price * order['amount']
+                ) / total_amount
+                existing_position.amount = total_amount
+                existing_position.value += position_value
+                existing_position.stop_loss = position.stop_loss
+                existing_position.take_profit_levels = position.take_profit_levels
+            else:
+                self.positions[order['symbol']] = position
+            self._index_position(self.positions[order['symbol']])
+            self._record_trade(trade)
+            self._stats['open'] += 1
+            self._stats['symbols'].add(order['symbol'])
+        
+        if logger.isEnabledFor(logging.INFO):
+            if reversed_position:
+                self._log_position_exit(reversed_position, 'reversal')
+            logger.info("%sOrder placed: %s %.4f %s", _ORDER_PREFIX, order['side'].upper(), order['amount'], order['symbol'])
+            logger.info("%sPosition value: $%.2f", _VALUE_PREFIX, position_value)
+            logger.info("%sStop loss: $%.2f", _STOP_PREFIX, risk_mgmt['stop_loss']['price'])
+        
+        return True
     
-    def simulate_position_exit(self, position: Dict, reason: str) -> bool:
-        """Simulate position exit"""
-        try:
-            # Remove from positions
-            self.positions = [p for p in self.positions if p != position]
-            
-            # Add to trade history
-            trade = {
-                'symbol': position['symbol'],
-                'action': 'close',
-                'side': position['side'],
-                'amount': position['amount'],
-                'price': position['entry_price'] * 1.02,  # Simulated 2% profit
-                'reason': reason,
-                'timestamp': datetime.now()
-            }
-            
-            self.trade_history.append(trade)
-            
-            logger.info(f"🔄 Position closed: {position['side'].upper()} {position['amount']:.4f} {position['symbol']}")
-            logger.info(f"📊 Reason: {reason}")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error simulating position exit: {e}")
+    def simulate_position_exit(self, position: Position, reason: str) -> bool:
+        """Simulate position exit
+        
+        Returns False without recording anything if position is no longer
+        the open position for its symbol, e.g. another thread already closed it.
+        """
+        with self._lock:
+            closed = self._close_position(position, reason)
+        
+        if closed and logger.isEnabledFor(logging.INFO):
+            self._log_position_exit(position, reason)
+        
+        return closed
+    
+    def _close_position(self, position: Position, reason: str) -> bool:
+        """Remove a position and record its closing trade if it is still open (caller holds the lock)"""
+        if self.positions.get(position.symbol) is not position:
             return False
+        
+        # Add to trade history
+        trade = Trade(
+            symbol=position.symbol,
+            action='close',
+            side=position.side,
+            amount=position.amount,
+            price=position.entry_price * 1.02,  # Simulated 2% profit
+            reason=reason,
+            ts_ns=time.time_ns()
+        )
+        
+        # Remove from positions
+        del self.positions[position.symbol]
+        self._unindex_position(position.symbol)
+        self._record_trade(trade)
+        self._stats['closed'] += 1
+        self._stats['symbols'].add(position.symbol)
+        return True
+    
+    def _log_position_exit(self, position: Position, reason: str):
+        """Log a closed position and why it was closed"""
+        logger.info("%sPosition closed: %s %.4f %s", _CLOSE_PREFIX, position.side.name, position.amount, position.symbol)
+        logger.info("%sReason: %s", _REASON_PREFIX, reason)
     
-    def get_position(self, symbol: str) -> Optional[Dict]:
+    def get_position(self, symbol: str) -> Optional[Position]:
         """Get existing position for symbol"""
-        for position in self.positions:
-            if position['symbol'] == symbol:
-                return position
-        return None
+        return self.positions.get(symbol)
     
-    def analyze_symbol(self, symbol: str) -> bool:
-        """Analyze a symbol and execute appropriate strategy"""
-        logger.info(f"🔍 Analyzing {symbol}")
+    def analyze_symbol(self, symbol: str, signal: Optional[Dict[str, Any]] = None,
+                       instructions: Optional[Dict[str, Any]] = None,
+                       validation: Optional[Dict[str, Any]] = None) -> bool:
+        """Analyze a symbol and execute appropriate strategy
+        
+        Pre-fetched signal, instructions and validation are used when given;
+        anything missing is requested from the API for this symbol alone.
+        """
+        logger.info("%sAnalyzing %s", _ANALYZE_PREFIX, symbol)
         
         # Get enhanced signal
-        signal = self.get_enhanced_signal(symbol)
+        if signal is None:
+            signal = self.get_enhanced_signal(symbol)
         if not signal:
-            logger.warning(f"Could not get signal for {symbol}")
+            logger.warning("Could not get signal for %s", symbol)
             return False
         
         # Check confidence threshold
         if signal['confidence'] < self.confidence_threshold:
-            logger.info(f"⚠️ Signal confidence ({signal['confidence']}%) below threshold ({self.confidence_threshold}%)")
+            logger.info("%sSignal confidence (%s%%) below threshold (%s%%)", _WARN_PREFIX, signal['confidence'], self.confidence_threshold)
             return False
         
         # Get bot instructions
-        instructions = self.get_bot_instructions(symbol)
+        if instructions is None:
+            instructions = self.get_bot_instructions(symbol)
         if not instructions:
-            logger.warning(f"Could not get bot instructions for {symbol}")
+            logger.warning("Could not get bot instructions for %s", symbol)
             return False
         
         # Validate strategy
-        validation = self.validate_strategy(signal)
+        if validation is None:
+            validation = self.validate_strategy(signal)
         if not validation.get('valid', False):
-            logger.warning(f"❌ Strategy validation failed for {symbol}")
-            logger.warning(f"Validation details: {validation}")
+            logger.warning("%sStrategy validation failed for %s", _FAIL_PREFIX, symbol)
+            logger.warning("Validation details: %s", validation)
             return False
         
-        # Check position limits
-        if len(self.positions) >= self.max_positions:
-            logger.info(f"📊 Maximum positions ({self.max_positions}) reached")
+        # Check position limits (enforced again when the order is placed)
+        with self._lock:
+            open_positions = len(self.positions)
+        if open_positions >= self.max_positions:
+            logger.info("%sMaximum positions (%s) reached", _STATS_PREFIX, self.max_positions)
             return False
         
         # Execute strategy
-        success = self.execute_strategy(symbol, instructions)
+        try:
+            success = self.execute_strategy(symbol, instructions)
+        except KeyError:
+            logger.exception("Malformed bot instructions for %s", symbol)
+            success = False
         
         if success:
-            logger.info(f"✅ Strategy executed successfully for {symbol}")
+            logger.info("%sStrategy executed successfully for %s", _SUCCESS_PREFIX, symbol)
         else:
-            logger.error(f"❌ Strategy execution failed for {symbol}")
+            logger.error("%sStrategy execution failed for %s", _FAIL_PREFIX, symbol)
         
         return success
     
-    def run_trading_cycle(self, symbols: List[str]):
-        """Run one complete trading cycle"""
-        logger.info("🚀 Starting trading cycle")
-        logger.info(f"📊 Analyzing {len(symbols)} symbols")
+    def _analyze_symbol_safe(self, symbol: str, prefetched: Dict[str, Dict[str, Any]]) -> bool:
+        """Analyze a symbol from a worker thread without letting errors escape"""
+        try:
+            return self.analyze_symbol(symbol, **prefetched)
+        except Exception:
+            logger.exception("Error analyzing %s", symbol)
+            return False
+    
+    def fetch_cycle_data(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch signal, instructions and validation for every symbol of a cycle"""
+        # Fetch everything the cycle needs with one request per endpoint.
+        # Signals and instructions are independent, so both are in flight at once;
+        # validation needs the signals and runs once they arrive.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            signals_future = executor.submit(self.get_enhanced_signals_batch, symbols)
+            instructions_future = executor.submit(self.get_bot_instructions_batch, symbols)
+            signals = signals_future.result()
+            instructions = instructions_future.result()
+        
+        candidates = [s for s in symbols
+                      if s in signals and s in instructions
+                      and signals[s].get('confidence', 0) >= self.confidence_threshold]
+        validations = self.validate_strategies_batch(
+            {s: signals[s] for s in candidates}
+        ) if candidates else {}
+        
+        return {
+            s: {
+                'signal': signals.get(s),
+                'instructions': instructions.get(s),
+                'validation': validations.get(s)
+            }
+            for s in symbols
+        }
+    
+    def run_trading_cycle(self, symbols: List[str], prefetched: Optional[Dict[str, Dict[str, Any]]] = None):
+        """Run one complete trading cycle
+        
+        prefetched is the result of fetch_cycle_data; when omitted it is
+        fetched at the start of the cycle.
+        """
+        logger.info("%sStarting trading cycle", _START_PREFIX)
+        logger.info("%sAnalyzing %s symbols", _STATS_PREFIX, len(symbols))
         
         # Display current portfolio status
         self.display_portfolio_status()
         
-        # Analyze each symbol
-        for symbol in symbols:
-            try:
-                self.analyze_symbol(symbol)
-                time.sleep(2)  # Rate limiting
-                
-            except Exception as e:
-                logger.error(f"Error analyzing {symbol}: {e}")
-                continue
+        if prefetched is None:
+            prefetched = self.fetch_cycle_data(symbols)
+        
+        # Analyze all symbols in parallel
+        self._map_concurrently(lambda s: self._analyze_symbol_safe(s, prefetched.get(s, {})), symbols)
         
         # Display updated portfolio status
         self.display_portfolio_status()
         
-        logger.info("🏁 Trading cycle completed")
+        logger.info("%sTrading cycle completed", _DONE_PREFIX)
     
     def display_portfolio_status(self):
         """Display current portfolio status"""
-        logger.info("📊 Portfolio Status:")
-        logger.info(f"💰 Account Balance: ${self.account_balance:,.2f}")
-        logger.info(f"📈 Open Positions: {len(self.positions)}")
-        logger.info(f"📋 Total Trades: {len(self.trade_history)}")
+        # Snapshot under the lock; workers and the order scheduler may be trading meanwhile
+        with self._lock:
+            positions = [(p.symbol, p.side.name, p.value) for p in self.positions.values()]
+            total_trades = self._stats['open'] + self._stats['closed']
+            total_value = float(self._values[:self._n].sum())
+        
+        logger.info("%sPortfolio Status:", _STATS_PREFIX)
+        logger.info("%sAccount Balance: $%.2f", _BALANCE_PREFIX, self.account_balance)
+        logger.info("%sOpen Positions: %s", _POSITIONS_PREFIX, len(positions))
+        logger.info("%sTotal Trades: %s", _TRADES_PREFIX, total_trades)
         
-        if self.positions:
-            total_value = sum(p['value'] for p in self.positions)
-            logger.info(f"💼 Total Position Value: ${total_value:,.2f}")
+        if positions:
+            logger.info("%sTotal Position Value: $%.2f", _EXPOSURE_PREFIX, total_value)
             
-            for position in self.positions:
-                logger.info(f"   {position['symbol']}: {position['side'].upper()} ${position['value']:,.2f}")
+            for symbol, side, value in positions:
+                logger.info("   %s: %s $%.2f", symbol, side, value)
     
     def run_continuous_trading(self, symbols: List[str], cycle_interval: int = 300):
-        """Run continuous trading with specified interval"""
-        logger.info(f"🔄 Starting continuous trading with {cycle_interval}s intervals")
+        """Run continuous trading with specified interval
+        
+        A background fetcher pulls each cycle's data every cycle_interval
+        seconds, so the next cycle's signals load while the current one executes.
+        """
+        logger.info("%sStarting continuous trading with %ss intervals", _LOOP_PREFIX, cycle_interval)
+        
+        cycles = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        
+        def fetch_cycles():
+            while not stop.is_set():
+                started = time.monotonic()
+                try:
+                    prefetched = self.fetch_cycle_data(symbols)
+                except Exception as e:
+                    logger.error("Error fetching cycle data: %s", e)
+                    prefetched = {}
+                
+                while not stop.is_set():
+                    try:
+                        cycles.put(prefetched, timeout=1)
+                        break
+                    except queue.Full:
+                        continue
+                
+                wait = max(0, cycle_interval - (time.monotonic() - started))
+                logger.info("%sNext signals in %.0f seconds...", _SLEEP_PREFIX, wait)
+                stop.wait(wait)
+        
+        fetcher = threading.Thread(target=fetch_cycles, name='cycle-fetcher', daemon=True)
+        fetcher.start()
         
         try:
             while True:
-                self.run_trading_cycle(symbols)
-                logger.info(f"😴 Sleeping for {cycle_interval} seconds...")
-                time.sleep(cycle_interval)
+                # Short timeouts keep the wait interruptible by Ctrl+C, including on Windows
+                try:
+                    prefetched = cycles.get(timeout=1)
+                except queue.Empty:
+                    continue
+                self.run_trading_cycle(symbols, prefetched=prefetched)
                 
         except KeyboardInterrupt:
-            logger.info("⏹️ Trading stopped by user")
+            logger.info("%sTrading stopped by user", _STOPPED_PREFIX)
         except Exception as e:
-            logger.error(f"❌ Continuous trading error: {e}")
+            logger.error("%sContinuous trading error: %s", _FAIL_PREFIX, e)
+        finally:
+            stop.set()
     
-    def get_performance_summary(self) -> Dict[str, Any]:
-        """Get trading performance summary"""
-        if not self.trade_history:
-            return {'message': 'No trades executed yet'}
+    def get_performance_summary(self, detailed: bool = False) -> Dict[str, Any]:
+        """Get trading performance summary
         
-        trades_df = pd.DataFrame(self.trade_history)
+        Counts come from the running statistics; pass detailed=True to also
+        build a per-symbol breakdown from the trades this bot wrote to the trade log.
+        """
+        with self._lock:
+            if not self.trade_history:
+                return {'message': 'No trades executed yet'}
+            
+            open_trades = self._stats['open']
+            closed_trades = self._stats['closed']
+            
+            summary = {
+                'total_trades': open_trades + closed_trades,
+                'open_trades': open_trades,
+                'closed_trades': closed_trades,
+                'symbols_traded': len(self._stats['symbols']),
+                'account_balance': self.account_balance,
+                'open_positions': len(self.positions),
+                'last_trade': _record_to_dict(self.trade_history[-1])
+            }
         
-        total_trades = len(trades_df)
-        open_trades = len(trades_df[trades_df['action'] == 'open'])
-        closed_trades = len(trades_df[trades_df['action'] == 'close'])
+        if detailed:
+            import pandas as pd  # Only needed for the detailed breakdown
+            
+            trades_df = pd.DataFrame(list(self.read_trade_log()))
+            summary['trades_by_symbol'] = (
+                trades_df.groupby(['symbol', 'action']).size().unstack(fill_value=0).to_dict(orient='index')
+            )
         
-        return {
-            'total_trades': total_trades,
-            'open_trades': open_trades,
-            'closed_trades': closed_trades,
-            'symbols_traded': trades_df['symbol'].nunique(),
-            'account_balance': self.account_balance,
-            'open_positions': len(self.positions),
-            'last_trade': trades_df.iloc[-1].to_dict() if not trades_df.empty else None
-        }
+        return summary
 
 def main():
     """Main function to run the enhanced trading bot"""
@@ -542,6 +1146,7 @@ def main():
         else:
             # Run single cycle
             bot.run_trading_cycle(config['symbols'])
+            bot.order_scheduler.wait_until_idle()
             
             # Display performance summary
             performance = bot.get_performance_summary()
@@ -552,7 +1157,9 @@ def main():
         print("\n⏹️ Bot stopped by user")
     except Exception as e:
         print(f"\n❌ Bot error: {e}")
-        logger.error(f"Bot error: {e}")
+        logger.error("Bot error: %s", e)
+    finally:
+        bot.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file